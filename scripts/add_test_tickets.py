@@ -1,252 +1,228 @@
 """Script to add test tickets to the database."""
 import asyncio
+import logging
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
+
 # Add parent directory to path to import src modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config.settings import Settings
 from src.database.connection import create_pool, close_pool
-from src.agent.ticket_agent import create_ticket_agent
-from src.main import extract_customer_info
-
-
-# Test tickets with different categories, priorities, and sentiments
-TEST_TICKETS = [
-    {
-        "content": """
-Subject: Billing Error - Charged Twice This Month!
-
-Hello,
-
-I just checked my bank statement and noticed I was charged TWICE for my monthly subscription!
-This is completely unacceptable. I've been a loyal customer for over 2 years and this has never
-happened before.
-
-I need this fixed IMMEDIATELY and I want a full refund for the duplicate charge. This better
-not happen again or I'm canceling my subscription.
-
-My account email is: sarah.johnson@email.com
-Account name: Sarah Johnson
-
-Please respond ASAP.
-
-Frustrated,
-Sarah Johnson
-""",
-        "description": "Billing - Duplicate charge (Critical, Negative)"
-    },
-    {
-        "content": """
-Subject: Can't login to my account
-
-Hi there,
-
-I've been trying to log into my account for the past hour but I keep getting an error message
-saying "Invalid credentials" even though I'm 100% sure my password is correct. I've tried
-resetting it twice already and the same issue happens.
-
-This is really frustrating because I need to access my dashboard for an important presentation
-tomorrow morning.
-
-Account email: mike.chen@techcorp.com
-Account name: Mike Chen
-
-Thanks for your help.
-
-Mike
-""",
-        "description": "Technical - Login issue (High, Negative)"
-    },
-    {
-        "content": """
-Subject: Feature Request - Dark Mode
-
-Hello!
-
-I absolutely love your product! I use it every day and it's been a game-changer for my workflow.
-
-I was wondering if you could add a dark mode option? I often work late at night and it would
-be much easier on my eyes. I noticed some of your competitors have this feature and it would
-be amazing to have it in your app too.
+from src.database.queries import insert_tickets
+from src.agent.ticket_agent import create_ticket_agent, shutdown as shutdown_agent
+from src.utils.loop import run_with_fast_loop
+from src.utils.log import start_logging, stop_logging
+from src.main import resolve_customer_info
 
-Keep up the great work!
+logger = logging.getLogger(__name__)
 
-Best regards,
-Account name: Emma Wilson
-Account email: emma.wilson@design.io
-""",
-        "description": "Feature Request - Dark mode (Low, Positive)"
-    },
-    {
-        "content": """
-Subject: Question about pricing plans
 
-Hi,
+@dataclass(frozen=True, slots=True)
+class TestTicket:
+    """A seed ticket and a short description of what it exercises."""
+    content: str
+    description: str
 
-I'm currently on the Basic plan and I'm considering upgrading to Pro. Could you explain what
-the main differences are? I see that Pro has "advanced analytics" but I'm not sure what that
-includes exactly.
 
-Also, if I upgrade mid-month, will I be charged the full amount or prorated?
+# Pipeline tuning: concurrent LLM analyses, analyzed tickets waiting to be
+# saved, and rows per insert
+ANALYSIS_WORKERS = 8
+ANALYSIS_QUEUE_SIZE = 32
+DB_BATCH_SIZE = 8
 
-Thanks!
+# End-of-stream marker for the database writer
+_DONE = object()
 
-Account name: James Rodriguez
-Account email: j.rodriguez@startup.com
-""",
-        "description": "General - Pricing inquiry (Medium, Neutral)"
-    },
-    {
-        "content": """
-Subject: URGENT - System down, losing revenue!
-
-THIS IS CRITICAL!!!
-
-Our entire payment processing system has been down for 3 HOURS. We are losing thousands of
-dollars every minute this continues. Our customers can't complete purchases and we're getting
-bombarded with complaints.
-
-This is absolutely UNACCEPTABLE for an enterprise plan customer. We need someone on this
-IMMEDIATELY or we're switching providers and demanding a full refund.
-
-Contact me NOW: 555-0199
-
-Account name: David Park
-Account email: david.park@enterprise.com
-Director of Operations
-""",
-        "description": "Technical - System outage (Critical, Very Negative)"
-    },
-    {
-        "content": """
-Subject: Thank you for the excellent support!
-
-Hi team,
-
-I just wanted to send a quick note to say thank you for the amazing support I received
-yesterday from Alex. He was patient, knowledgeable, and went above and beyond to help me
-set up my integration.
-
-Your product is fantastic and your support team makes it even better. Keep it up!
-
-Cheers,
-Account name: Lisa Anderson
-Account email: lisa.anderson@creative.co
-""",
-        "description": "General - Thank you note (Low, Very Positive)"
-    }
-]
 
+# Test tickets with different categories, priorities, and sentiments
+TEST_TICKETS_FILE = Path(__file__).parent / "test_tickets.json"
+TEST_TICKETS: tuple[TestTicket, ...] = tuple(
+    TestTicket(**ticket) for ticket in orjson.loads(TEST_TICKETS_FILE.read_bytes())
+)
 
-async def process_ticket(agent, pool, ticket_data):
-    """Process a single ticket through the AI agent and save to database."""
-    content = ticket_data["content"]
-    description = ticket_data["description"]
 
-    print(f"\n{'='*60}")
-    print(f"Processing: {description}")
-    print(f"{'='*60}")
+async def analyze_ticket(agent, pool, ticket: TestTicket):
+    """Analyze a single ticket with the AI agent and return a database record."""
+    content = ticket.content
+    description = ticket.description
 
-    # Extract customer info
-    customer_info = extract_customer_info(content)
-    print(f"Customer: {customer_info['name']} ({customer_info['email']})")
+    # Buffer output so concurrently analyzed tickets don't interleave
+    lines = [
+        f"\n{'='*60}",
+        f"Analyzing: {description}",
+        f"{'='*60}",
+    ]
 
-    # Analyze with AI agent
-    print("Analyzing with AI...")
+    # Analyze with AI agent (also extracts customer info)
     result = await agent.run(
         f"Analyze this customer support ticket:\n\n{content}",
         deps=pool
     )
 
-    # Display results
-    print(f"  Summary: {result.output.summary}")
-    print(f"  Category: {result.output.category}")
-    print(f"  Priority: {result.output.priority}")
-    print(f"  Sentiment: {result.output.sentiment_score:.2f}")
-
-    # Save to database
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            # UPSERT customer
-            customer_id = await conn.fetchval("""
-                INSERT INTO customers (email, name)
-                VALUES ($1, $2)
-                ON CONFLICT (email) DO UPDATE SET name = EXCLUDED.name
-                RETURNING id
-            """, customer_info['email'], customer_info['name'])
-
-            # Insert ticket
-            ticket_id = await conn.fetchval("""
-                INSERT INTO tickets (
-                    customer_id, raw_content, summary,
-                    category, priority, sentiment_score
-                )
-                VALUES ($1, $2, $3, $4::category_enum, $5::priority_enum, $6)
-                RETURNING id
-            """,
-                customer_id,
-                content,
-                result.output.summary,
-                result.output.category,
-                result.output.priority,
-                result.output.sentiment_score
-            )
-
-    print(f"  ✓ Saved as Ticket #{ticket_id} for Customer #{customer_id}")
-    return ticket_id
-
-
-async def main():
-    """Process all test tickets."""
-    print("="*60)
-    print("Adding Test Tickets to Database")
-    print("="*60)
+    customer_info = resolve_customer_info(content, result.output)
+    lines.append(f"Customer: {customer_info['name']} ({customer_info['email']})")
+
+    # Collect results
+    lines.append(f"  Summary: {result.output.summary}")
+    lines.append(f"  Category: {result.output.category}")
+    lines.append(f"  Priority: {result.output.priority}")
+    lines.append(f"  Sentiment: {result.output.sentiment_score:.2f}")
+    logger.info("\n".join(lines))
+
+    return (
+        customer_info['email'],
+        customer_info['name'],
+        content,
+        result.output.summary,
+        result.output.category,
+        result.output.priority,
+        result.output.sentiment_score
+    )
+
+
+async def run_pipeline(agent, pool, tickets, workers: int):
+    """
+    Analyze tickets and save them to the database as an overlapping pipeline.
+
+    Analysis workers push results onto a bounded queue while a single writer
+    drains it into batched inserts, so database writes proceed while later
+    tickets are still being analyzed.
+
+    Args:
+        agent: Ticket classification agent
+        pool: Database connection pool
+        tickets: Tickets to process
+        workers: Number of concurrent analysis workers
+
+    Returns:
+        Tuple of (inserted ticket IDs, list of (ticket, error) failures)
+    """
+    analysis_queue: asyncio.Queue = asyncio.Queue(maxsize=ANALYSIS_QUEUE_SIZE)
+    ticket_iter = iter(tickets)
+    ticket_ids = []
+    failures = []
+
+    async def analyze_worker():
+        # Workers share one iterator; next() never yields, so no locking is needed
+        for ticket in ticket_iter:
+            try:
+                record = await analyze_ticket(agent, pool, ticket)
+            except Exception as e:
+                failures.append((ticket, e))
+                continue
+            await analysis_queue.put(record)
+
+    async def db_worker():
+        batch = []
+        while True:
+            record = await analysis_queue.get()
+            if record is _DONE:
+                break
+            batch.append(record)
+            # Flush when the batch is full or nothing else is ready yet
+            if len(batch) >= DB_BATCH_SIZE or analysis_queue.empty():
+                ticket_ids.extend(await insert_tickets(pool, batch))
+                batch = []
+
+        if batch:
+            ticket_ids.extend(await insert_tickets(pool, batch))
+
+    writer = asyncio.create_task(db_worker())
+    analyzers = asyncio.gather(*(analyze_worker() for _ in range(workers)))
+
+    # If the writer dies, stop the analyzers rather than let them block on a full queue
+    await asyncio.wait({writer, analyzers}, return_when=asyncio.FIRST_COMPLETED)
+    if writer.done():
+        analyzers.cancel()
+        await asyncio.gather(analyzers, return_exceptions=True)
+        writer.result()
+
+    await analysis_queue.put(_DONE)
+    await writer
+
+    return ticket_ids, failures
+
+
+async def main() -> int:
+    """
+    Process all test tickets.
+
+    Returns:
+        Process exit code: 0 if every ticket was saved, 1 otherwise
+    """
+    logger.info("="*60)
+    logger.info("Adding Test Tickets to Database")
+    logger.info("="*60)
 
     pool = None
     try:
         # Load configuration
-        print("\n[1/3] Loading configuration...")
+        logger.info("\n[1/3] Loading configuration...")
         settings = Settings.from_env()
-        print(f"  ✓ Connected to database: {settings.db_name}")
-
-        # Initialize database connection
-        print("\n[2/3] Creating database connection pool...")
-        pool = await create_pool(settings.database_dsn)
-        print("  ✓ Connection pool created")
+        logger.info(f"  ✓ Connected to database: {settings.db_name}")
+
+        # Initialize database connection (seed data doesn't need durable commits)
+        logger.info("\n[2/3] Creating database connection pool...")
+        pool = await create_pool(
+            settings.database_dsn,
+            min_size=settings.db_min_size,
+            max_size=settings.db_max_size,
+            max_queries=settings.db_max_queries,
+            max_inactive_connection_lifetime=settings.db_max_inactive_conn_lifetime,
+            bulk_mode=True
+        )
+        logger.info("  ✓ Connection pool created")
 
         # Create AI agent
-        print("\n[3/3] Creating AI agent...")
+        logger.info("\n[3/3] Creating AI agent...")
         agent = create_ticket_agent(settings.gemini_api_key)
-        print("  ✓ Agent ready")
-
-        # Process all test tickets
-        print(f"\nProcessing {len(TEST_TICKETS)} test tickets...")
-        ticket_ids = []
-        for i, ticket_data in enumerate(TEST_TICKETS, 1):
-            print(f"\n[Ticket {i}/{len(TEST_TICKETS)}]")
-            ticket_id = await process_ticket(agent, pool, ticket_data)
-            ticket_ids.append(ticket_id)
+        logger.info("  ✓ Agent ready")
+
+        # Analyze and save through a two-stage pipeline; analysis concurrency
+        # is capped by ANALYSIS_WORKERS (LLM requests), independent of the
+        # pool, which only the single database writer uses
+        logger.info(f"\nProcessing {len(TEST_TICKETS)} test tickets...")
+        ticket_ids, failures = await run_pipeline(
+            agent,
+            pool,
+            TEST_TICKETS,
+            workers=min(len(TEST_TICKETS), ANALYSIS_WORKERS)
+        )
 
         # Summary
-        print(f"\n{'='*60}")
-        print("✓ All tickets processed successfully!")
-        print(f"{'='*60}")
-        print(f"Total tickets created: {len(ticket_ids)}")
-        print(f"Ticket IDs: {', '.join(map(str, ticket_ids))}")
+        logger.info(f"\n{'='*60}")
+        if failures:
+            logger.error(f"✗ {len(failures)} ticket(s) failed:")
+            for ticket, error in failures:
+                logger.error(f"  - {ticket.description}: {error}", exc_info=error)
+        else:
+            logger.info("✓ All tickets processed successfully!")
+        logger.info(f"{'='*60}")
+        logger.info(f"Total tickets created: {len(ticket_ids)}")
+        logger.info(f"Ticket IDs: {', '.join(map(str, ticket_ids))}")
+
+        return 1 if failures else 0
 
     except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"\n✗ Error: {e}")
         raise
 
     finally:
+        await shutdown_agent()
+
         if pool is not None:
-            print("\nClosing database connection pool...")
+            logger.info("\nClosing database connection pool...")
             await close_pool(pool)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    start_logging()
+    try:
+        exit_code = run_with_fast_loop(main())
+    finally:
+        stop_logging()
+    sys.exit(exit_code)
@@ -1,33 +1,15 @@
 """Ticket classification agent using PydanticAI and Google Gemini."""
-import os
+import functools
+from typing import Optional
 import asyncpg
+import httpx
 from pydantic_ai import Agent
 from pydantic_ai.models.google import GoogleModel
+from pydantic_ai.providers.google import GoogleProvider
 from src.models.schemas import ProcessedTicket
 
 
-def create_ticket_agent(api_key: str) -> Agent[asyncpg.Pool, ProcessedTicket]:
-    """
-    Create and configure the ticket classification agent.
-
-    Args:
-        api_key: Google Gemini API key
-
-    Returns:
-        Configured PydanticAI agent
-    """
-    # Set the API key as an environment variable (required by GoogleModel)
-    os.environ['GOOGLE_API_KEY'] = api_key
-
-    # Initialize Google Gemini model (uses GOOGLE_API_KEY environment variable)
-    model = GoogleModel('gemini-2.5-flash')
-
-    # Create agent with dependency injection and structured output
-    agent = Agent(
-        model=model,
-        deps_type=asyncpg.Pool,
-        output_type=ProcessedTicket,
-        system_prompt="""You are an expert customer support ticket analyzer.
+SYSTEM_PROMPT = """You are an expert customer support ticket analyzer.
 
 Your task is to analyze customer support tickets and extract the following information:
 
@@ -51,7 +33,90 @@ Your task is to analyze customer support tickets and extract the following infor
    - Emotional indicators (exclamation marks, capitalization)
    - Overall tone and context
 
+5. **Customer**: Extract the customer's email address and full name, typically found in
+   signature or account lines (e.g. "Email:", "Account name:"). If not present, return
+   'unknown@example.com' and 'Unknown Customer'.
+
 Analyze the ticket carefully and provide accurate, well-reasoned classifications."""
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP client for Gemini API requests.
+
+    pydantic-ai already shares a pooled keepalive client by default; this one
+    additionally enables HTTP/2, so concurrent agent runs are multiplexed over
+    a single connection.
+
+    Returns:
+        Configured async HTTP client
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        timeout=httpx.Timeout(60.0, connect=5.0)
     )
 
-    return agent
+
+@functools.lru_cache(maxsize=1)
+def _default_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client used when none is supplied."""
+    return create_http_client()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_agent(
+    api_key: str,
+    http_client: httpx.AsyncClient
+) -> Agent[asyncpg.Pool, ProcessedTicket]:
+    """Build the agent once per (api_key, http_client) pair."""
+    # Initialize Google Gemini model on top of the shared HTTP client
+    provider = GoogleProvider(api_key=api_key, http_client=http_client)
+    model = GoogleModel('gemini-2.5-flash', provider=provider)
+
+    # Create agent with dependency injection and structured output
+    return Agent(
+        model=model,
+        deps_type=asyncpg.Pool,
+        output_type=ProcessedTicket,
+        system_prompt=SYSTEM_PROMPT
+    )
+
+
+def create_ticket_agent(
+    api_key: str,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> Agent[asyncpg.Pool, ProcessedTicket]:
+    """
+    Create and configure the ticket classification agent.
+
+    The agent is memoized, so repeated calls with the same key and client
+    return the same instance instead of rebuilding the model and agent.
+
+    Args:
+        api_key: Google Gemini API key
+        http_client: Optional HTTP client owned (and closed) by the caller.
+            If omitted, a module-owned client is used; release it with
+            shutdown().
+
+    Returns:
+        Configured PydanticAI agent
+    """
+    if http_client is None:
+        http_client = _default_http_client()
+
+    return _build_agent(api_key, http_client)
+
+
+async def shutdown() -> None:
+    """
+    Close the module-owned HTTP client and drop the memoized agent.
+
+    Call this once the event loop that used the agent is finishing; the next
+    create_ticket_agent() call builds a fresh client and agent.
+    """
+    if _default_http_client.cache_info().currsize:
+        await _default_http_client().aclose()
+
+    _default_http_client.cache_clear()
+    _build_agent.cache_clear()
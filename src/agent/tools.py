@@ -1,6 +1,7 @@
 """Agent tools for ticket processing."""
 import asyncpg
 from pydantic_ai import RunContext
+from src.database.queries import insert_ticket
 
 
 async def register_tools(agent):
@@ -36,32 +37,15 @@ async def register_tools(agent):
         Returns:
             Confirmation message with ticket and customer IDs
         """
-        pool = ctx.deps
-
-        async with pool.acquire() as conn:
-            # Start a transaction
-            async with conn.transaction():
-                # UPSERT customer (insert or update on conflict)
-                customer_id = await conn.fetchval("""
-                    INSERT INTO customers (email, name)
-                    VALUES ($1, $2)
-                    ON CONFLICT (email)
-                    DO UPDATE SET name = EXCLUDED.name
-                    RETURNING id
-                """, customer_email, customer_name)
-
-                # Insert ticket with enum casting
-                ticket_id = await conn.fetchval("""
-                    INSERT INTO tickets (
-                        customer_id,
-                        raw_content,
-                        summary,
-                        category,
-                        priority,
-                        sentiment_score
-                    )
-                    VALUES ($1, $2, $3, $4::category_enum, $5::priority_enum, $6)
-                    RETURNING id
-                """, customer_id, raw_content, summary, category, priority, sentiment_score)
+        ticket_id, customer_id = await insert_ticket(
+            ctx.deps,
+            customer_email,
+            customer_name,
+            raw_content,
+            summary,
+            category,
+            priority,
+            sentiment_score
+        )
 
         return f"Successfully saved ticket #{ticket_id} for customer '{customer_name}' (ID: {customer_id})"
@@ -1,11 +1,15 @@
 """Application configuration management."""
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.parse import quote_plus
 from dotenv import load_dotenv
 
+# Read .env once at import rather than on every settings lookup
+load_dotenv()
 
-@dataclass
+
+@dataclass(frozen=True)
 class Settings:
     """Application settings loaded from environment variables."""
     gemini_api_key: str
@@ -14,12 +18,28 @@ class Settings:
     db_name: str
     db_user: str
     db_password: str
+    db_min_size: int = 2
+    db_max_size: int = 20
+    db_max_queries: int = 50000
+    db_max_inactive_conn_lifetime: float = 300.0
+    bulk_mode: bool = False
+    database_dsn: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build PostgreSQL connection DSN with properly encoded credentials."""
+        # URL-encode the username and password to handle special characters
+        user = quote_plus(self.db_user)
+        password = quote_plus(self.db_password)
+        object.__setattr__(
+            self,
+            "database_dsn",
+            f"postgresql://{user}:{password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        )
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "Settings":
-        """Load settings from environment variables."""
-        load_dotenv()
-
+        """Load settings from environment variables (cached after first call)."""
         # Validate required environment variables
         required_vars = [
             "GEMINI_API_KEY",
@@ -40,13 +60,10 @@ class Settings:
             db_port=int(os.getenv("DB_PORT", "5432")),
             db_name=os.getenv("DB_NAME"),
             db_user=os.getenv("DB_USER"),
-            db_password=os.getenv("DB_PASSWORD")
+            db_password=os.getenv("DB_PASSWORD"),
+            db_min_size=int(os.getenv("DB_MIN_SIZE", "2")),
+            db_max_size=int(os.getenv("DB_MAX_SIZE", "20")),
+            db_max_queries=int(os.getenv("DB_MAX_QUERIES", "50000")),
+            db_max_inactive_conn_lifetime=float(os.getenv("DB_MAX_INACTIVE_CONN_LIFETIME", "300.0")),
+            bulk_mode=os.getenv("DB_BULK_MODE", "false").lower() in ("1", "true", "yes")
         )
-
-    @property
-    def database_dsn(self) -> str:
-        """Build PostgreSQL connection DSN with properly encoded credentials."""
-        # URL-encode the username and password to handle special characters
-        user = quote_plus(self.db_user)
-        password = quote_plus(self.db_password)
-        return f"postgresql://{user}:{password}@{self.db_host}:{self.db_port}/{self.db_name}"
@@ -1,9 +1,19 @@
 """Database connection pool management."""
+import logging
 import asyncpg
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
 
-async def create_pool(dsn: str, min_size: int = 2, max_size: int = 10) -> asyncpg.Pool:
+
+async def create_pool(
+    dsn: str,
+    min_size: int = 2,
+    max_size: int = 20,
+    max_queries: int = 50000,
+    max_inactive_connection_lifetime: float = 300.0,
+    bulk_mode: bool = False
+) -> asyncpg.Pool:
     """
     Create an asyncpg connection pool.
 
@@ -11,15 +21,30 @@ async def create_pool(dsn: str, min_size: int = 2, max_size: int = 10) -> asyncp
         dsn: PostgreSQL connection string
         min_size: Minimum pool size
         max_size: Maximum pool size
+        max_queries: Queries served by a connection before it is replaced
+        max_inactive_connection_lifetime: Seconds an idle connection is kept open
+        bulk_mode: Skip waiting for WAL flush on commit (seed/bulk loads only;
+            a crash may lose the most recent commits)
 
     Returns:
         Configured connection pool
     """
+    # Sent as startup parameters, so they cost no extra round trips and
+    # survive the RESET ALL asyncpg issues when a connection is released.
+    # JIT compilation only adds latency to our small, short-lived queries.
+    server_settings = {'jit': 'off'}
+    if bulk_mode:
+        server_settings['synchronous_commit'] = 'off'
+
     # Disable SSL since the server doesn't support it
     return await asyncpg.create_pool(
         dsn,
         min_size=min_size,
         max_size=max_size,
+        max_queries=max_queries,
+        max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        statement_cache_size=1024,
+        server_settings=server_settings,
         command_timeout=60,
         ssl=False
     )
@@ -39,7 +64,7 @@ async def init_database(pool: asyncpg.Pool) -> None:
     # Execute schema initialization
     async with pool.acquire() as conn:
         await conn.execute(schema_sql)
-        print("Database schema initialized successfully")
+        logger.info("Database schema initialized successfully")
 
 
 async def close_pool(pool: asyncpg.Pool) -> None:
@@ -50,4 +75,4 @@ async def close_pool(pool: asyncpg.Pool) -> None:
         pool: Database connection pool
     """
     await pool.close()
-    print("Database connection pool closed")
+    logger.info("Database connection pool closed")
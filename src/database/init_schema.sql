@@ -15,7 +15,7 @@ CREATE TABLE IF NOT EXISTS customers (
     id SERIAL PRIMARY KEY,
     email VARCHAR(255) UNIQUE NOT NULL,
     name VARCHAR(255) NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
 -- Create tickets table
@@ -27,7 +27,7 @@ CREATE TABLE IF NOT EXISTS tickets (
     category category_enum NOT NULL,
     priority priority_enum NOT NULL,
     sentiment_score FLOAT NOT NULL CHECK (sentiment_score >= 0 AND sentiment_score <= 1),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
 -- Create indexes for common queries
@@ -35,3 +35,10 @@ CREATE INDEX IF NOT EXISTS idx_tickets_customer_id ON tickets(customer_id);
 CREATE INDEX IF NOT EXISTS idx_tickets_category ON tickets(category);
 CREATE INDEX IF NOT EXISTS idx_tickets_priority ON tickets(priority);
 CREATE INDEX IF NOT EXISTS idx_customers_email ON customers(email);
+
+-- Recent-tickets listing (ORDER BY created_at DESC LIMIT n)
+CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON tickets(created_at DESC);
+
+-- Recent urgent tickets (small partial index, only high/critical rows)
+CREATE INDEX IF NOT EXISTS idx_tickets_urgent_created_at ON tickets(created_at DESC)
+    WHERE priority IN ('high', 'critical');
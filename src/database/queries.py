@@ -0,0 +1,139 @@
+"""Shared SQL statements for ticket persistence."""
+import asyncpg
+
+
+# asyncpg prepares each distinct query text once per connection and keeps the
+# handle in its statement cache, so this must stay a module-level constant:
+# every caller sending the identical string reuses the same prepared statement.
+#
+# The customer UPSERT and ticket INSERT run as a single statement, which is
+# atomic on its own and needs one round trip instead of BEGIN/two
+# queries/COMMIT. DO UPDATE (rather than DO NOTHING) guarantees the CTE
+# returns the customer id even when the email already exists.
+#
+# The ::category_enum/::priority_enum casts are required: parameters in the
+# INSERT ... SELECT list are not typed from the target columns, so the casts
+# are what give them the enum types. A client-side enum codec would not save
+# anything either, since the server (enum_recv) still looks up each label in
+# the catalog whatever format it arrives in.
+INSERT_TICKET_SQL = """
+    WITH customer AS (
+        INSERT INTO customers (email, name)
+        VALUES ($1, $2)
+        ON CONFLICT (email) DO UPDATE SET name = EXCLUDED.name
+        RETURNING id
+    )
+    INSERT INTO tickets (
+        customer_id, raw_content, summary,
+        category, priority, sentiment_score
+    )
+    SELECT id, $3, $4, $5::category_enum, $6::priority_enum, $7
+    FROM customer
+    RETURNING id, customer_id
+"""
+
+
+async def insert_ticket(
+    pool: asyncpg.Pool,
+    customer_email: str,
+    customer_name: str,
+    raw_content: str,
+    summary: str,
+    category: str,
+    priority: str,
+    sentiment_score: float
+) -> tuple[int, int]:
+    """
+    UPSERT the customer and insert a new ticket for them.
+
+    Args:
+        pool: Database connection pool
+        customer_email: Customer's email address
+        customer_name: Customer's full name
+        raw_content: Original ticket content
+        summary: Analyzed summary of the ticket
+        category: Ticket category (billing/technical/feature_request/general)
+        priority: Ticket priority (low/medium/high/critical)
+        sentiment_score: Sentiment analysis score (0.0-1.0)
+
+    Returns:
+        Tuple of (ticket_id, customer_id)
+    """
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            INSERT_TICKET_SQL,
+            customer_email,
+            customer_name,
+            raw_content,
+            summary,
+            category,
+            priority,
+            sentiment_score
+        )
+
+    return row['id'], row['customer_id']
+
+
+# Bulk loading: each statement binds whole columns as arrays and expands them
+# with unnest(), so a batch of any size costs one round trip per table.
+UPSERT_CUSTOMERS_SQL = """
+    INSERT INTO customers (email, name)
+    SELECT * FROM unnest($1::text[], $2::text[]) AS t(email, name)
+    ON CONFLICT (email) DO UPDATE SET name = EXCLUDED.name
+    RETURNING id, email
+"""
+
+INSERT_TICKETS_SQL = """
+    INSERT INTO tickets (
+        customer_id, raw_content, summary,
+        category, priority, sentiment_score
+    )
+    SELECT * FROM unnest(
+        $1::int[], $2::text[], $3::text[],
+        $4::category_enum[], $5::priority_enum[], $6::float8[]
+    )
+    RETURNING id
+"""
+
+
+async def insert_tickets(
+    pool: asyncpg.Pool,
+    records: list[tuple[str, str, str, str, str, str, float]]
+) -> list[int]:
+    """
+    Bulk UPSERT customers and insert their tickets in one transaction.
+
+    Args:
+        pool: Database connection pool
+        records: Tuples of (customer_email, customer_name, raw_content,
+            summary, category, priority, sentiment_score)
+
+    Returns:
+        IDs of the inserted tickets
+    """
+    # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement,
+    # so deduplicate by email; the last name seen for an email wins
+    customers = {email: name for email, name, *_ in records}
+
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            customer_ids = {
+                row['email']: row['id']
+                for row in await conn.fetch(
+                    UPSERT_CUSTOMERS_SQL,
+                    list(customers.keys()),
+                    list(customers.values())
+                )
+            }
+
+            rows = await conn.fetch(
+                INSERT_TICKETS_SQL,
+                [customer_ids[r[0]] for r in records],
+                [r[2] for r in records],
+                [r[3] for r in records],
+                [r[4] for r in records],
+                [r[5] for r in records],
+                [r[6] for r in records]
+            )
+
+    return [row['id'] for row in rows]
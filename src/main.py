@@ -1,12 +1,17 @@
 """Main application entry point."""
-import asyncio
+import logging
 import re
 import sys
 from src.config.settings import Settings
 from src.database.connection import create_pool, init_database, close_pool
-from src.agent.ticket_agent import create_ticket_agent
+from src.database.queries import insert_ticket
+from src.agent.ticket_agent import create_ticket_agent, shutdown as shutdown_agent
+from src.utils.loop import run_with_fast_loop
+from src.utils.log import start_logging, stop_logging
 from src.display.table_display import display_recent_tickets
 
+logger = logging.getLogger(__name__)
+
 
 # Sample customer tickets for testing
 SAMPLE_TICKETS = [
@@ -105,37 +110,75 @@ import random
 # Select a random sample ticket for default mode
 SAMPLE_TICKET = random.choice(SAMPLE_TICKETS)
 
+# Placeholders used when a ticket has no customer info
+UNKNOWN_EMAIL = 'unknown@example.com'
+UNKNOWN_NAME = 'Unknown Customer'
+
+# Customer info patterns, compiled once at import
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Matches "Name: ...", "Account name: ...", "Full name: ..." and
+# "Customer name: ..." lines; trailing \r is excluded for CRLF tickets
+NAME_RE = re.compile(
+    r'(?im)^[ \t]*(?:(?:account|customer|full)[ \t]+)?name[ \t]*:[ \t]*(.+?)[ \t\r]*$'
+)
+
+# Customer info usually sits in the signature/account block at the end of a
+# ticket, so only this many trailing characters are scanned first
+SIGNATURE_TAIL_CHARS = 1024
+
 
 def extract_customer_info(ticket_content: str) -> dict:
     """
     Simple extraction of customer info from ticket.
 
-    In production, this could be more sophisticated or use the agent itself.
+    The agent extracts customer info itself; this is only used as a fallback
+    when the model could not find it (see resolve_customer_info).
     """
-    email = None
-    name = None
-
-    # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    matches = re.findall(email_pattern, ticket_content)
-    if matches:
-        email = matches[0]
-
-    # Extract name (look for "name:" pattern or "Name:" at start of word)
-    for line in ticket_content.split('\n'):
-        if 'name:' in line.lower():
-            # Split only on the first colon after "name"
-            idx = line.lower().find('name:')
-            if idx != -1:
-                name = line[idx + 5:].strip()
-                break
+    # Scan the signature block first. The window is widened back to the start
+    # of the line it falls in, so a line is never cut (no partial email or
+    # "name:" match) and never dropped
+    tail = ticket_content
+    if len(ticket_content) > SIGNATURE_TAIL_CHARS:
+        start = ticket_content.rfind('\n', 0, len(ticket_content) - SIGNATURE_TAIL_CHARS) + 1
+        tail = ticket_content[start:]
+
+    match = EMAIL_RE.search(tail)
+    if match is None and tail is not ticket_content:
+        match = EMAIL_RE.search(ticket_content)
+    email = match.group(0) if match else None
+
+    match = NAME_RE.search(tail)
+    if match is None and tail is not ticket_content:
+        match = NAME_RE.search(ticket_content)
+    name = match.group(1) if match else None
 
     return {
-        'email': email or 'unknown@example.com',
-        'name': name or 'Unknown Customer'
+        'email': email or UNKNOWN_EMAIL,
+        'name': name or UNKNOWN_NAME
     }
 
 
+def resolve_customer_info(ticket_content: str, output) -> dict:
+    """
+    Return customer info from the agent output, falling back to regex extraction.
+
+    Args:
+        ticket_content: Original ticket content
+        output: ProcessedTicket returned by the agent
+
+    Returns:
+        Dictionary with 'email' and 'name' keys
+    """
+    customer_info = {'email': output.customer_email, 'name': output.customer_name}
+    if customer_info['email'] == UNKNOWN_EMAIL or customer_info['name'] == UNKNOWN_NAME:
+        fallback = extract_customer_info(ticket_content)
+        if customer_info['email'] == UNKNOWN_EMAIL:
+            customer_info['email'] = fallback['email']
+        if customer_info['name'] == UNKNOWN_NAME:
+            customer_info['name'] = fallback['name']
+    return customer_info
+
+
 def get_ticket_input() -> str:
     """
     Get ticket content from command line args or interactive input.
@@ -183,65 +226,48 @@ def get_interactive_ticket() -> str:
 
 async def process_single_ticket(ticket_content: str, agent, pool):
     """Process a single ticket and return the ticket ID."""
-    print("\n--- TICKET CONTENT ---")
-    print(ticket_content)
-    print("--- END TICKET ---\n")
-
-    # Extract customer info
-    customer_info = extract_customer_info(ticket_content)
-    print(f"  ✓ Extracted customer: {customer_info['name']} ({customer_info['email']})")
+    logger.info("\n--- TICKET CONTENT ---")
+    logger.info(ticket_content)
+    logger.info("--- END TICKET ---\n")
 
-    # Run agent analysis
-    print("  Analyzing ticket with AI agent...")
+    # Run agent analysis (also extracts customer info)
+    logger.info("  Analyzing ticket with AI agent...")
     result = await agent.run(
         f"Analyze this customer support ticket:\n\n{ticket_content}",
         deps=pool
     )
 
+    customer_info = resolve_customer_info(ticket_content, result.output)
+    logger.info(f"  ✓ Extracted customer: {customer_info['name']} ({customer_info['email']})")
+
     # Save to database
-    print("  Saving to database...")
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            # UPSERT customer
-            customer_id = await conn.fetchval("""
-                INSERT INTO customers (email, name)
-                VALUES ($1, $2)
-                ON CONFLICT (email) DO UPDATE SET name = EXCLUDED.name
-                RETURNING id
-            """, customer_info['email'], customer_info['name'])
-
-            # Insert ticket
-            ticket_id = await conn.fetchval("""
-                INSERT INTO tickets (
-                    customer_id, raw_content, summary,
-                    category, priority, sentiment_score
-                )
-                VALUES ($1, $2, $3, $4::category_enum, $5::priority_enum, $6)
-                RETURNING id
-            """,
-                customer_id,
-                ticket_content,
-                result.output.summary,
-                result.output.category,
-                result.output.priority,
-                result.output.sentiment_score
-            )
+    logger.info("  Saving to database...")
+    ticket_id, customer_id = await insert_ticket(
+        pool,
+        customer_info['email'],
+        customer_info['name'],
+        ticket_content,
+        result.output.summary,
+        result.output.category,
+        result.output.priority,
+        result.output.sentiment_score
+    )
 
-    print(f"  ✓ Saved as Ticket #{ticket_id} for Customer #{customer_id}\n")
+    logger.info(f"  ✓ Saved as Ticket #{ticket_id} for Customer #{customer_id}\n")
     return ticket_id
 
 
 async def main():
     """Main application flow."""
-    print("=" * 60)
-    print("PydanticAI Ticket Classification System")
-    print("=" * 60)
-    print("\nUsage:")
-    print("  python -m src.main                    # Use random sample ticket")
-    print("  python -m src.main --all              # Process all 5 sample tickets")
-    print("  python -m src.main --interactive      # Enter ticket interactively")
-    print("  python -m src.main \"Your ticket...\"   # Provide ticket as argument")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("PydanticAI Ticket Classification System")
+    logger.info("=" * 60)
+    logger.info("\nUsage:")
+    logger.info("  python -m src.main                    # Use random sample ticket")
+    logger.info("  python -m src.main --all              # Process all 5 sample tickets")
+    logger.info("  python -m src.main --interactive      # Enter ticket interactively")
+    logger.info("  python -m src.main \"Your ticket...\"   # Provide ticket as argument")
+    logger.info("=" * 60)
 
     pool = None
     try:
@@ -249,38 +275,45 @@ async def main():
         ticket_input = get_ticket_input()
 
         # 1. Load configuration
-        print("\n[1/5] Loading configuration...")
+        logger.info("\n[1/5] Loading configuration...")
         settings = Settings.from_env()
-        print(f"  ✓ Loaded settings for database: {settings.db_name}")
+        logger.info(f"  ✓ Loaded settings for database: {settings.db_name}")
 
         # 2. Initialize database connection pool
-        print("\n[2/5] Initializing database connection pool...")
-        pool = await create_pool(settings.database_dsn)
-        print("  ✓ Connection pool created")
+        logger.info("\n[2/5] Initializing database connection pool...")
+        pool = await create_pool(
+            settings.database_dsn,
+            min_size=settings.db_min_size,
+            max_size=settings.db_max_size,
+            max_queries=settings.db_max_queries,
+            max_inactive_connection_lifetime=settings.db_max_inactive_conn_lifetime,
+            bulk_mode=settings.bulk_mode
+        )
+        logger.info("  ✓ Connection pool created")
 
         # 3. Initialize database schema
-        print("\n[3/5] Initializing database schema...")
+        logger.info("\n[3/5] Initializing database schema...")
         await init_database(pool)
-        print("  ✓ Schema initialized")
+        logger.info("  ✓ Schema initialized")
 
         # 4. Create ticket classification agent
-        print("\n[4/5] Creating AI agent...")
+        logger.info("\n[4/5] Creating AI agent...")
         agent = create_ticket_agent(settings.gemini_api_key)
-        print("  ✓ Agent created with Google Gemini (gemini-2.5-flash)")
+        logger.info("  ✓ Agent created with Google Gemini (gemini-2.5-flash)")
 
         # 5. Process ticket(s)
         if ticket_input == 'ALL_SAMPLES':
             # Process all 5 sample tickets
-            print(f"\n[5/5] Processing all {len(SAMPLE_TICKETS)} sample tickets...")
+            logger.info(f"\n[5/5] Processing all {len(SAMPLE_TICKETS)} sample tickets...")
             last_ticket_id = None
             for i, ticket_content in enumerate(SAMPLE_TICKETS, 1):
-                print(f"\n{'='*60}")
-                print(f"Processing Ticket {i}/{len(SAMPLE_TICKETS)}")
-                print(f"{'='*60}")
+                logger.info(f"\n{'='*60}")
+                logger.info(f"Processing Ticket {i}/{len(SAMPLE_TICKETS)}")
+                logger.info(f"{'='*60}")
                 last_ticket_id = await process_single_ticket(ticket_content, agent, pool)
 
             # Display table with the last processed ticket highlighted
-            print(f"\n[6/6] Displaying Recent Tickets:")
+            logger.info(f"\n[6/6] Displaying Recent Tickets:")
             await display_recent_tickets(
                 pool=pool,
                 limit=5,
@@ -288,32 +321,38 @@ async def main():
             )
         else:
             # Process single ticket
-            print("\n[5/5] Processing ticket...")
+            logger.info("\n[5/5] Processing ticket...")
             ticket_id = await process_single_ticket(ticket_input, agent, pool)
 
             # Display results in Rich table
-            print(f"[6/6] Displaying Recent Tickets:")
+            logger.info(f"[6/6] Displaying Recent Tickets:")
             await display_recent_tickets(
                 pool=pool,
                 limit=5,
                 highlight_id=ticket_id
             )
 
-        print("\n✓ Processing complete!")
+        logger.info("\n✓ Processing complete!")
 
     except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"\n✗ Error: {e}")
         raise
 
     finally:
         # Cleanup
+        await shutdown_agent()
+
         if pool is not None:
-            print("\nClosing database connection pool...")
+            logger.info("\nClosing database connection pool...")
             await close_pool(pool)
-            print("✓ Cleanup complete")
+            logger.info("✓ Cleanup complete")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Synchronous logging keeps status lines in order with the interactive
+    # prompt and the Rich table, which write to stdout directly
+    start_logging(queued=False)
+    try:
+        run_with_fast_loop(main())
+    finally:
+        stop_logging()
@@ -2,7 +2,7 @@
 from typing import Optional
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import Enum as SAEnum, Text, Float
+from sqlalchemy import Enum as SAEnum, Text, Float, DateTime, func
 from src.utils.enums import Priority, Category
 
 
@@ -14,7 +14,10 @@ class Customer(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, nullable=False, max_length=255)
     name: str = Field(nullable=False, max_length=255)
-    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 class Ticket(SQLModel, table=True):
@@ -39,4 +42,7 @@ class Ticket(SQLModel, table=True):
         sa_column=Column(Float, nullable=False)
     )
 
-    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
@@ -1,11 +1,13 @@
 """Pydantic schemas for ticket processing."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from src.utils.enums import Priority, Category
 
 
 class ProcessedTicket(BaseModel):
     """Structured output from ticket analysis agent."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     summary: str = Field(
         description="Concise 1-2 sentence summary of the ticket"
     )
@@ -24,6 +26,10 @@ class ProcessedTicket(BaseModel):
         description="Sentiment score from 0.0 (very negative) to 1.0 (very positive)"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
+    customer_email: EmailStr = Field(
+        description="Customer's email address, or unknown@example.com if not present"
+    )
+
+    customer_name: str = Field(
+        description="Customer's full name, or Unknown Customer if not present"
+    )
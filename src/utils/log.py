@@ -0,0 +1,60 @@
+"""Console logging setup."""
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def start_logging(level: int = logging.INFO, queued: bool = True) -> None:
+    """
+    Send log records to stdout.
+
+    With queued=True, callers only enqueue records; formatting and the
+    blocking stdout write happen on a background listener thread, so logging
+    never stalls the event loop. Use queued=False for interactive CLIs that
+    also write to stdout directly (prompts, Rich tables): records are then
+    written synchronously and stay in order with that output.
+
+    Args:
+        level: Root logger level
+        queued: Write records from a background thread instead of inline
+    """
+    global _handler, _listener
+    if _handler is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    if queued:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _handler = logging.handlers.QueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+    else:
+        _handler = stream_handler
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_handler)
+
+    # Keep per-request HTTP client chatter out of the console output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def stop_logging() -> None:
+    """Flush pending log records and detach the console handler."""
+    global _handler, _listener
+    if _handler is None:
+        return
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    logging.getLogger().removeHandler(_handler)
+    _handler = None
@@ -0,0 +1,28 @@
+"""Event loop selection helpers."""
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_with_fast_loop(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on uvloop when it is available.
+
+    Uses uvloop.run(), which creates the loop directly instead of going
+    through the deprecated event loop policy API (uvloop.install()). Falls
+    back to asyncio.run() when uvloop is not installed (e.g. on Windows,
+    where uvloop is not supported).
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    return uvloop.run(main)